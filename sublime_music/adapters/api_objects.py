@@ -2,9 +2,7 @@
 Defines the objects that are returned by adapter methods.
 """
 import abc
-import logging
 from datetime import datetime, timedelta
-from functools import lru_cache, partial
 from typing import (
     Any,
     Callable,
@@ -19,7 +17,7 @@ from typing import (
     cast,
 )
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
 
 
 class Genre(abc.ABC):
@@ -124,21 +122,6 @@ class PlayQueue(abc.ABC):
     current_index: Optional[int]
 
 
-@lru_cache(maxsize=8192)
-def similarity_ratio(query: str, string: str) -> int:
-    """
-    Return the :class:`thefuzz.fuzz.partial_ratio` between the ``query`` and
-    the given ``string``.
-
-    This ends up being called quite a lot, so the result is cached in an LRU
-    cache using :class:`functools.lru_cache`.
-
-    :param query: the query string
-    :param string: the string to compare to the query string
-    """
-    return fuzz.partial_ratio(query, string)
-
-
 class SearchResult:
     """
     An object representing the aggregate results of a search which can include
@@ -147,14 +130,21 @@ class SearchResult:
 
     def __init__(self, query: Optional[str] = None):
         self.query = query
-        self.similiarity_partial = partial(
-            similarity_ratio, self.query.lower() if self.query else ""
-        )
         self._artists: Dict[str, Artist] = {}
         self._albums: Dict[str, Album] = {}
         self._songs: Dict[str, Song] = {}
         self._playlists: Dict[str, Playlist] = {}
 
+        # Lowercased searchable strings for each candidate, keyed by result type and
+        # then by ID. Each entry also holds the object that the strings were computed
+        # from, so that they are recomputed if a result is replaced by another object.
+        self._search_strings: Dict[str, Dict[str, Tuple[Any, Optional[Tuple[str, ...]]]]] = {
+            "artists": {},
+            "albums": {},
+            "songs": {},
+            "playlists": {},
+        }
+
     def __repr__(self) -> str:
         fields = ("query", "_artists", "_albums", "_songs", "_playlists")
         formatted_fields = (f"{f}={getattr(self, f)}" for f in fields)
@@ -179,40 +169,69 @@ class SearchResult:
 
     def _to_result(
         self,
-        it: Dict[str, _S],
+        result_type: str,
         transform: Callable[[_S], Tuple[Optional[str], ...]],
     ) -> List[_S]:
         assert self.query
-        all_results = []
-        for value in it.values():
-            transformed = transform(value)
-            if any(t is None for t in transformed):
-                continue
-
-            max_similarity = max(
-                self.similiarity_partial(t.lower()) for t in transformed if t is not None
-            )
-            if max_similarity < 60:
+        it = cast(Dict[str, SearchResult._S], getattr(self, f"_{result_type}"))
+        search_strings = self._search_strings[result_type]
+
+        # Flatten every searchable string of every candidate into a single list so that
+        # rapidfuzz can score all of them in one call. ``keys`` maps each choice back to
+        # the candidate that it came from.
+        choices: List[str] = []
+        keys: List[str] = []
+        strings_per_result = 1
+        for key, value in it.items():
+            cached = search_strings.get(key)
+            if cached is None or cached[0] is not value:
+                transformed = transform(value)
+                strings = (
+                    None
+                    if any(t is None for t in transformed)
+                    else tuple(cast(str, t).lower() for t in transformed)
+                )
+                search_strings[key] = cached = (value, strings)
+
+            if cached[1] is None:
                 continue
 
-            all_results.append((max_similarity, value))
-
-        all_results.sort(key=lambda rx: rx[0], reverse=True)
+            strings_per_result = max(strings_per_result, len(cached[1]))
+            for t in cached[1]:
+                choices.append(t)
+                keys.append(key)
+
+        # The matches are sorted by score, so the first match for each candidate is its
+        # best one. Each candidate contributes at most strings_per_result choices, so the
+        # best 20 distinct candidates are always within the top 20 * strings_per_result
+        # matches. Limiting the matches lets rapidfuzz do a partial sort instead of
+        # sorting every match.
+        matches = process.extract(
+            self.query.lower(),
+            choices,
+            scorer=fuzz.partial_ratio,
+            # Older versions of rapidfuzz preprocess the strings (stripping punctuation,
+            # etc.) by default, which changes the scores. They are already lowercased.
+            processor=None,
+            score_cutoff=60,
+            limit=20 * strings_per_result,
+        )
 
         result: List[SearchResult._S] = []
-        for ratio, x in all_results:
-            if ratio >= 60 and len(result) < 20:
-                result.append(x)
-            else:
-                # No use going on, all the rest are less.
+        seen = set()
+        for _, _, i in matches:
+            if keys[i] in seen:
+                continue
+            seen.add(keys[i])
+            result.append(it[keys[i]])
+            if len(result) == 20:
                 break
 
-        logging.debug(similarity_ratio.cache_info())
         return result
 
     @property
     def artists(self) -> List[Artist]:
-        return self._to_result(self._artists, lambda a: (a.name,))
+        return self._to_result("artists", lambda a: (a.name,))
 
     def _try_get_artist_name(self, obj: Union[Album, Song]) -> Optional[str]:
         try:
@@ -223,12 +242,12 @@ class SearchResult:
 
     @property
     def albums(self) -> List[Album]:
-        return self._to_result(self._albums, lambda a: (a.name, self._try_get_artist_name(a)))
+        return self._to_result("albums", lambda a: (a.name, self._try_get_artist_name(a)))
 
     @property
     def songs(self) -> List[Song]:
-        return self._to_result(self._songs, lambda s: (s.title, self._try_get_artist_name(s)))
+        return self._to_result("songs", lambda s: (s.title, self._try_get_artist_name(s)))
 
     @property
     def playlists(self) -> List[Playlist]:
-        return self._to_result(self._playlists, lambda p: (p.name,))
+        return self._to_result("playlists", lambda p: (p.name,))
@@ -126,9 +126,8 @@ class ConfigureServerForm(Gtk.Box):
                     (config_store.get_secret if is_password else config_store.get),
                 )(key),
                 hexpand=True,
+                visibility=not is_password,
             )
-            if is_password:
-                entry.set_visibility(False)
 
             entry.connect(
                 "changed",
@@ -163,7 +162,9 @@ class ConfigureServerForm(Gtk.Box):
 
             label = Gtk.Label(label=cpd.description, halign=Gtk.Align.END)
 
-            input_el_box = Gtk.Box()
+            # A single-row Gtk.Grid is used rather than a Gtk.Box because the Box
+            # re-measures its children repeatedly while distributing leftover space.
+            input_el_grid = Gtk.Grid()
             self.entries[key] = cast(
                 Callable[[str], Gtk.Widget],
                 {
@@ -175,7 +176,7 @@ class ConfigureServerForm(Gtk.Box):
                     Path: create_path_input,
                 }[cpd.type],
             )(key)
-            input_el_box.add(self.entries[key])
+            input_el_grid.attach(self.entries[key], 0, 0, 1, 1)
 
             if cpd.helptext:
                 help_icon = Gtk.Image.new_from_icon_name(
@@ -184,15 +185,15 @@ class ConfigureServerForm(Gtk.Box):
                 )
                 help_icon.get_style_context().add_class("configure-form-help-icon")
                 help_icon.set_tooltip_markup(cpd.helptext)
-                input_el_box.add(help_icon)
+                input_el_grid.attach(help_icon, 1, 0, 1, 1)
 
             if not cpd.advanced:
                 content_grid.attach(label, 0, content_grid_i, 1, 1)
-                content_grid.attach(input_el_box, 1, content_grid_i, 1, 1)
+                content_grid.attach(input_el_grid, 1, content_grid_i, 1, 1)
                 content_grid_i += 1
             else:
                 advanced_grid.attach(label, 0, advanced_grid_i, 1, 1)
-                advanced_grid.attach(input_el_box, 1, advanced_grid_i, 1, 1)
+                advanced_grid.attach(input_el_grid, 1, advanced_grid_i, 1, 1)
                 advanced_grid_i += 1
 
         # Add a button and revealer for the advanced section of the configuration.
@@ -261,6 +262,7 @@ class ConfigureServerForm(Gtk.Box):
                 self.config_verification_box.add(
                     Gtk.Label(label="<b>Verifying configuration...</b>", use_markup=True)
                 )
+                self.config_verification_box.show_all()
             self.verifying_in_progress = True
         else:
             self.verifying_in_progress = False
@@ -284,7 +286,7 @@ class ConfigureServerForm(Gtk.Box):
             elif escaped := bleach.clean(error_text or ""):
                 set_icon_and_label("config-error-symbolic", escaped)
 
-        self.config_verification_box.show_all()
+            self.config_verification_box.show_all()
 
     def _on_config_change(self, key: str, value: Any, secret: bool = False):
         if secret:
@@ -159,8 +159,14 @@ class FilesystemAdapter(CachingAdapter):
         ignore_cache_miss: bool = False,
         where_clauses: Tuple[Any, ...] | None = None,
         order_by: Any = None,
+        join_models: Tuple[Any, ...] = (),
     ) -> Sequence:
-        result = model.select()
+        # Selecting the joined models along with the model populates the foreign keys on
+        # each row, rather than running another query every time one is accessed.
+        result = model.select(model, *join_models)
+        for join_model in join_models:
+            result = result.join_from(model, join_model)
+
         if where_clauses is not None:
             result = result.where(*where_clauses)
 
@@ -385,6 +391,7 @@ class FilesystemAdapter(CachingAdapter):
                 ~(models.Album.id.startswith("invalid:")),
                 models.Album.artist.is_null(False),
             ),
+            join_models=(models.Artist,),
         )
 
     def get_album(self, album_id: str) -> API.Album:
@@ -417,6 +424,7 @@ class FilesystemAdapter(CachingAdapter):
                 CachingAdapter.CachedDataKey.SONG,
                 ignore_cache_miss=True,
                 where_clauses=(models.Song.artist.is_null(False),),
+                join_models=(models.Artist,),
             ),
         )
         search_result.add_results(
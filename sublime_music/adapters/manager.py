@@ -11,7 +11,7 @@ from datetime import timedelta
 from enum import Enum
 from functools import partial
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 from typing import (
     Any,
     Callable,
@@ -60,6 +60,14 @@ DOWNLOAD_BLOCK_DELAY: Optional[float] = None
 if delay_str := os.environ.get("DOWNLOAD_BLOCK_DELAY"):
     DOWNLOAD_BLOCK_DELAY = float(delay_str)
 
+# How long (in seconds) and how many server search results are reused for repeated
+# queries, for example when the user deletes a character that they just typed.
+SEARCH_RESULTS_CACHE_TTL = 60.0
+SEARCH_RESULTS_CACHE_SIZE = 128
+
+# Shorter queries match nearly everything, so they are not searched at all.
+MIN_SEARCH_QUERY_LENGTH = 2
+
 T = TypeVar("T")
 
 
@@ -184,10 +192,12 @@ class DownloadProgress:
 
 class AdapterManager:
     available_adapters: Set[Any] = {FilesystemAdapter, SubsonicAdapter}
-    current_download_ids: Set[str] = set()
+    # Maps the ID of each resource that is currently being downloaded to a future that
+    # resolves to the downloaded filename (or the error) once that download finishes.
+    current_downloads: Dict[str, Future] = {}
     download_set_lock = threading.Lock()
-    executor: ThreadPoolExecutor = ThreadPoolExecutor()
-    download_executor: ThreadPoolExecutor = ThreadPoolExecutor()
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(thread_name_prefix="adapter")
+    download_executor: ThreadPoolExecutor = ThreadPoolExecutor(thread_name_prefix="download")
     is_shutting_down: bool = False
     _offline_mode: bool = False
 
@@ -205,6 +215,66 @@ class AdapterManager:
             self._download_dir = tempfile.TemporaryDirectory()
             self.download_path = Path(self._download_dir.name)
             self.download_limiter_semaphore = threading.Semaphore(self.concurrent_download_limit)
+            # Maps a query to the time that the ground truth adapter answered it and the
+            # result. This is reset along with the rest of the instance.
+            self.search_results_cache: Dict[str, Tuple[float, SearchResult]] = {}
+            # Server searches that are currently running, keyed by query.
+            self.inflight_searches: Dict[str, Future] = {}
+            # Guards both of the above, which are used by every running search. It is
+            # reentrant so that search_ground_truth can use the cache methods under it.
+            self.search_lock = threading.RLock()
+
+        def get_cached_search_result(self, query: str) -> Optional[SearchResult]:
+            with self.search_lock:
+                cached = self.search_results_cache.get(query)
+            if cached is None or monotonic() - cached[0] > SEARCH_RESULTS_CACHE_TTL:
+                return None
+            return cached[1]
+
+        def cache_search_result(self, query: str, search_result: SearchResult):
+            with self.search_lock:
+                self.search_results_cache.pop(query, None)
+                self.search_results_cache[query] = (monotonic(), search_result)
+                # Dicts preserve insertion order, so the first key is the oldest entry.
+                while len(self.search_results_cache) > SEARCH_RESULTS_CACHE_SIZE:
+                    del self.search_results_cache[next(iter(self.search_results_cache))]
+
+        def search_ground_truth(self, query: str) -> Tuple[SearchResult, bool]:
+            """
+            Searches the ground truth adapter. If the query has been answered recently,
+            or is already being searched, this returns that result instead of sending
+            another request. The second element of the tuple is whether this call did
+            the request.
+            """
+            with self.search_lock:
+                if (cached := self.get_cached_search_result(query)) is not None:
+                    return cached, False
+
+                future = self.inflight_searches.get(query)
+                if future is not None:
+                    requested = False
+                else:
+                    future = self.inflight_searches[query] = Future()
+                    requested = True
+
+            if not requested:
+                return future.result(), False
+
+            try:
+                search_result = self.ground_truth_adapter.search(query)
+            except Exception as e:
+                with self.search_lock:
+                    del self.inflight_searches[query]
+                future.set_exception(e)
+                raise
+
+            # Cache the result before removing the in-flight entry so that a search
+            # starting in between always finds one or the other.
+            with self.search_lock:
+                self.cache_search_result(query, search_result)
+                del self.inflight_searches[query]
+            future.set_result(search_result)
+            return search_result, True
 
         def song_download_progress(self, file_id: str, progress: DownloadProgress):
             self.on_song_download_progress(file_id, progress)
@@ -340,11 +410,14 @@ class AdapterManager:
         function_name: str,
         *params: Any,
         before_download: Callable[[], None] | None = None,
+        after_download: Callable[[Any], None] | None = None,
         partial_data: Any = None,
         **kwargs,
     ) -> Result:
         """
         Creates a Result using the given ``function_name`` on the ground truth adapter.
+        If ``after_download`` is given, it is called with the data in the same task,
+        before the result resolves.
         """
 
         def future_fn() -> Any:
@@ -359,10 +432,14 @@ class AdapterManager:
                 before_download()
             fn = getattr(AdapterManager._instance.ground_truth_adapter, function_name)
             try:
-                return fn(*params, **kwargs)
+                data = fn(*params, **kwargs)
             except Exception as e:
                 raise CacheMissError(partial_data=partial_data) from e
 
+            if after_download:
+                after_download(data)
+            return data
+
         return Result(future_fn)
 
     @staticmethod
@@ -370,13 +447,16 @@ class AdapterManager:
         uri: str,
         id: str,
         before_download: Callable[[], None] | None = None,
+        after_download: Callable[[str], None] | None = None,
         expected_size: int | None = None,
         **result_args,
     ) -> Result[str]:
         """
         Create a function to download the given URI to a temporary file, and return the
-        filename. The returned function will spin-loop if the resource is already being
-        downloaded to prevent multiple requests for the same download.
+        filename. The returned function will wait for the in-progress download if the
+        resource is already being downloaded to prevent multiple requests for the same
+        download. If ``after_download`` is given, it is called with the filename in the
+        same task, before the result resolves.
         """
         download_cancelled = False
 
@@ -388,9 +468,11 @@ class AdapterManager:
 
             resource_downloading = False
             with AdapterManager.download_set_lock:
-                if id in AdapterManager.current_download_ids:
+                if download_future := AdapterManager.current_downloads.get(id):
                     resource_downloading = True
-                AdapterManager.current_download_ids.add(id)
+                else:
+                    download_future = Future()
+                    AdapterManager.current_downloads[id] = download_future
 
             if before_download:
                 before_download()
@@ -410,13 +492,10 @@ class AdapterManager:
             if resource_downloading:
                 logging.info(f"{uri} already being downloaded.")
 
-                # The resource is already being downloaded. Busy loop until it has
-                # completed. Then, just return the path to the resource.
-                t = 0.0
-                while id in AdapterManager.current_download_ids and t < 20:
-                    sleep(0.2)
-                    t += 0.2
-                    # TODO (#122): handle the timeout
+                # The resource is already being downloaded. Wait until it has
+                # completed. If it failed (or doesn't finish within 20 seconds), this
+                # raises, so the path is only returned if the resource exists.
+                download_future.result(timeout=20)
             else:
                 logging.info(f"{uri} not found. Downloading...")
                 try:
@@ -480,6 +559,7 @@ class AdapterManager:
                             id,
                             DownloadProgress(DownloadProgress.Type.DONE),
                         )
+                    download_future.set_result(str(download_tmp_filename))
                 except Exception as e:
                     if expected_size_exists and not download_cancelled:
                         # Something failed. Post an error.
@@ -487,14 +567,18 @@ class AdapterManager:
                             id,
                             DownloadProgress(DownloadProgress.Type.ERROR, exception=e),
                         )
-                    # Re-raise the exception so that we can actually handle it.
+                    # Pass the error on to anyone waiting on this download, and re-raise
+                    # the exception so that we can actually handle it.
+                    download_future.set_exception(e)
                     raise
                 finally:
                     # Always release the download set lock, even if there's an error.
                     with AdapterManager.download_set_lock:
-                        AdapterManager.current_download_ids.discard(id)
+                        del AdapterManager.current_downloads[id]
 
             logging.info(f"{uri} downloaded. Returning.")
+            if after_download:
+                after_download(str(download_tmp_filename))
             return str(download_tmp_filename)
 
         def on_download_cancel():
@@ -504,22 +588,27 @@ class AdapterManager:
         return Result(download_fn, is_download=True, on_cancel=on_download_cancel, **result_args)
 
     @staticmethod
-    def _create_caching_done_callback(
+    def _create_caching_ingest_fn(
         cache_key: CachingAdapter.CachedDataKey, param: Optional[str]
-    ) -> Callable[[Result], None]:
+    ) -> Callable[[Any], None]:
         """
-        Create a function to let the caching_adapter ingest new data.
+        Create a function to let the caching_adapter ingest new data. It is meant to be
+        passed as the ``after_download`` function of a ground truth or download result.
 
         :param cache_key: the cache key to ingest.
         :param params: the parameters to uniquely identify the cached item.
         """
 
-        def future_finished(f: Result):
+        def ingest(data: Any):
             assert AdapterManager._instance
             assert AdapterManager._instance.caching_adapter
-            AdapterManager._instance.caching_adapter.ingest_new_data(cache_key, param, f.result())
+            try:
+                AdapterManager._instance.caching_adapter.ingest_new_data(cache_key, param, data)
+            except Exception:
+                # Failing to cache the data shouldn't fail the request for it.
+                logging.exception(f"Error ingesting {cache_key} for {param} into the cache.")
 
-        return future_finished
+        return ingest
 
     @staticmethod
     def get_supported_artist_query_types() -> Set[AlbumSearchQuery.Type]:
@@ -588,18 +677,17 @@ class AdapterManager:
             function_name,
             *((param,) if param is not None else ()),
             before_download=before_download,
+            after_download=(
+                AdapterManager._create_caching_ingest_fn(cache_key, param_str)
+                if cache_key and AdapterManager._instance.caching_adapter
+                else None
+            ),
             partial_data=partial_data,
             **kwargs,
         )
 
-        if AdapterManager._instance.caching_adapter:
-            if cache_key:
-                result.add_done_callback(
-                    AdapterManager._create_caching_done_callback(cache_key, param_str)
-                )
-
-            if on_result_finished:
-                result.add_done_callback(on_result_finished)
+        if AdapterManager._instance.caching_adapter and on_result_finished:
+            result.add_done_callback(on_result_finished)
 
         logging.info(f"END: {function_name}")
         logging.debug(result)
@@ -839,15 +927,15 @@ class AdapterManager:
                 ),
                 cover_art_id,
                 before_download,
-                default_value=existing_filename,
-            )
-
-            if AdapterManager._instance.caching_adapter:
-                future.add_done_callback(
-                    AdapterManager._create_caching_done_callback(
+                after_download=(
+                    AdapterManager._create_caching_ingest_fn(
                         CachingAdapter.CachedDataKey.COVER_ART_FILE, cover_art_id
                     )
-                )
+                    if AdapterManager._instance.caching_adapter
+                    else None
+                ),
+                default_value=existing_filename,
+            )
 
             return future
 
@@ -1262,24 +1350,24 @@ class AdapterManager:
         search_callback: Callable[[SearchResult], None],
         before_download: Callable[[], None] = lambda: None,
     ) -> Result[bool]:
-        if query == "":
-            search_callback(SearchResult(""))
-            return Result(True)
+        if len(query.strip()) < MIN_SEARCH_QUERY_LENGTH:
+            # This search is done, not cancelled, so resolve to False.
+            search_callback(SearchResult(query))
+            return Result(False)
 
         before_download()
 
-        # Keep track of if the result is cancelled and if it is, then don't do anything
-        # with any results.
-        cancelled = False
+        # Set when the result is cancelled. If it is, then don't do anything with any
+        # results. The debounce waits below return as soon as it is set.
+        cancelled = threading.Event()
 
         # This function actually does the search and calls the search_callback when each
         # of the futures completes. Returns whether or not it was cancelled.
         def do_search() -> bool:
-            # Sleep for a little while before returning the local results. They are less
+            # Wait for a little while before returning the local results. They are less
             # expensive to retrieve (but they still incur some overhead due to the GTK
             # UI main loop queue).
-            sleep(0.3)
-            if cancelled:
+            if cancelled.wait(0.3):
                 logging.info(f"Cancelled query {query} before caching adapter")
                 return True
 
@@ -1292,28 +1380,48 @@ class AdapterManager:
                 try:
                     logging.info(f"Returning caching adapter search results for '{query}'.")
                     search_result.update(AdapterManager._instance.caching_adapter.search(query))
-                    search_callback(search_result)
+                    if not cancelled.is_set():
+                        search_callback(search_result)
                 except Exception:
                     logging.exception("Error on caching adapter search")
 
             if not AdapterManager._ground_truth_can_do("search"):
-                return False
+                return cancelled.is_set()
+
+            # Server results for a recent identical query don't need the extra wait.
+            ground_truth_search_results = AdapterManager._instance.get_cached_search_result(query)
+            if ground_truth_search_results is not None:
+                logging.info(f"Returning cached server search results for '{query}'.")
+                search_result.update(ground_truth_search_results)
+                if not cancelled.is_set():
+                    search_callback(search_result)
+                return cancelled.is_set()
 
             # Wait longer to see if the user types anything else so we don't peg the
             # server with tons of requests.
-            sleep(1 if AdapterManager._instance.ground_truth_adapter.is_networked else 0.3)
-            if cancelled:
+            if cancelled.wait(
+                1 if AdapterManager._instance.ground_truth_adapter.is_networked else 0.3
+            ):
                 logging.info(f"Cancelled query {query} before server results")
                 return True
 
             try:
-                ground_truth_search_results = AdapterManager._instance.ground_truth_adapter.search(
-                    query
-                )  # noqa: E501
+                (
+                    ground_truth_search_results,
+                    requested,
+                ) = AdapterManager._instance.search_ground_truth(query)
                 search_result.update(ground_truth_search_results)
-                search_callback(search_result)
+                # Don't paint the results of a search that has been superseded while the
+                # request was running. They are still ingested below.
+                if not cancelled.is_set():
+                    search_callback(search_result)
             except Exception:
                 logging.exception("Failed getting search results from server for query '{query}'")
+                return cancelled.is_set()
+
+            # If another search did the request, it also ingests the results.
+            if not requested:
+                return cancelled.is_set()
 
             if AdapterManager._instance.caching_adapter:
                 AdapterManager._instance.caching_adapter.ingest_new_data(
@@ -1322,15 +1430,11 @@ class AdapterManager:
                     ground_truth_search_results,
                 )
 
-            return False
+            return cancelled.is_set()
 
         # When the future is cancelled (this will happen if a new search is created),
-        # set cancelled to True so that the search function can abort.
-        def on_cancel():
-            nonlocal cancelled
-            cancelled = True
-
-        return Result(do_search, on_cancel=on_cancel)
+        # set cancelled so that the search function can abort.
+        return Result(do_search, on_cancel=cancelled.set)
 
     # Cache Status Methods
     # ==================================================================================
@@ -1344,7 +1448,7 @@ class AdapterManager:
         return [
             SongCacheStatus.DOWNLOADING
             if (
-                song_id in AdapterManager.current_download_ids
+                song_id in AdapterManager.current_downloads
                 and song_id not in AdapterManager._cancelled_song_ids
             )
             else cached_statuses[song_id]
@@ -8,9 +8,10 @@ import pickle
 import random
 import string
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
 from urllib.parse import urlencode, urlparse
 
@@ -55,6 +56,41 @@ NETWORK_ALWAYS_ERROR: bool = False
 if always_error := os.environ.get("NETWORK_ALWAYS_ERROR"):
     NETWORK_ALWAYS_ERROR = True
 
+# How long to reuse the list of active WiFi connections before asking NetworkManager
+# again.
+ACTIVE_WIFI_CONNECTIONS_TTL = 30.0
+_active_wifi_connections: Optional[Tuple[float, Set[str]]] = None
+
+
+def get_active_wifi_connections() -> Set[str]:
+    """
+    Returns the IDs of the active WiFi connections according to NetworkManager.
+
+    Creating a NetworkManager client requires a round-trip over DBus, and adapters are
+    instantiated every time the server configuration is verified, so the result is
+    reused for ``ACTIVE_WIFI_CONNECTIONS_TTL`` seconds.
+    """
+    global _active_wifi_connections
+    now = monotonic()
+    if _active_wifi_connections:
+        timestamp, connection_ids = _active_wifi_connections
+        if now - timestamp < ACTIVE_WIFI_CONNECTIONS_TTL:
+            return connection_ids
+
+    connection_ids = set()
+    for ac in NM.Client.new().get_active_connections():
+        if ac.get_connection_type() != "802-11-wireless":
+            continue
+        devs = ac.get_devices()
+        if len(devs) != 1:
+            continue
+        if devs[0].get_device_type() != NM.DeviceType.WIFI:
+            continue
+        connection_ids.add(ac.get_id())
+
+    _active_wifi_connections = (now, connection_ids)
+    return connection_ids
+
 
 class ServerError(Exception):
     def __init__(self, status_code: int, message: str):
@@ -210,23 +246,10 @@ class SubsonicAdapter(Adapter):
             and (lan_address := config.get("local_network_address"))
             and networkmanager_imported
         ):
-            networkmanager_client = NM.Client.new()
-
-            # Only look at the active WiFi connections.
-            for ac in networkmanager_client.get_active_connections():
-                if ac.get_connection_type() != "802-11-wireless":
-                    continue
-                devs = ac.get_devices()
-                if len(devs) != 1:
-                    continue
-                if devs[0].get_device_type() != NM.DeviceType.WIFI:
-                    continue
-
-                # If connected to the Local Network SSID, then change the hostname to
-                # the Local Network Address.
-                if ssid == ac.get_id():
-                    self.hostname = lan_address
-                    break
+            # If connected to the Local Network SSID, then change the hostname to the
+            # Local Network Address.
+            if ssid in get_active_wifi_connections():
+                self.hostname = lan_address
 
         parsed_hostname = urlparse(self.hostname)
         if not parsed_hostname.scheme:
@@ -701,9 +724,8 @@ class SubsonicAdapter(Adapter):
         elif query.type == AlbumSearchQuery.Type.GENRE:
             extra_args = {"genre": query.genre.name}
 
-        albums: List[API.Album] = []
         page_size = 50 if query.type == AlbumSearchQuery.Type.RANDOM else 500
-        offset = 0
+        pages_per_batch = 4
 
         def get_page(offset: int) -> Sequence[API.Album]:
             album_list = self._get_json(
@@ -715,14 +737,23 @@ class SubsonicAdapter(Adapter):
             ).albums
             return album_list.album if album_list else []
 
-        # Get all pages.
-        while len(next_page := get_page(offset)) > 0:
-            albums.extend(next_page)
-            if query.type == AlbumSearchQuery.Type.RANDOM:
-                break
-            offset += page_size
-
-        return albums
+        # Get the first page. If it's not full, then there are no more albums.
+        albums: List[API.Album] = list(get_page(0))
+        if query.type == AlbumSearchQuery.Type.RANDOM or len(albums) < page_size:
+            return albums
+
+        # Otherwise, request the rest of the pages a few at a time in parallel until one
+        # of them comes back short, rather than waiting for each page before requesting
+        # the next one.
+        offset = page_size
+        with ThreadPoolExecutor(max_workers=pages_per_batch) as executor:
+            while True:
+                batch_end = offset + pages_per_batch * page_size
+                for page in executor.map(get_page, range(offset, batch_end, page_size)):
+                    albums.extend(page)
+                    if len(page) < page_size:
+                        return albums
+                offset = batch_end
 
     def get_album(self, album_id: str) -> API.Album:
         album = self._get_json(self._make_url("getAlbum"), id=album_id).album
@@ -1,6 +1,8 @@
 import logging
 import os
 import pickle
+import stat
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional, Type, Union
@@ -27,6 +29,32 @@ dataclasses_json.cfg.global_config.encoders[Path] = encode_path
 dataclasses_json.cfg.global_config.encoders[Optional[Path]] = encode_path  # type: ignore
 
 
+def write_atomically(path: Path, contents: Union[str, bytes]):
+    """
+    Writes ``contents`` to a temporary file next to ``path`` and then moves it into
+    place, so that ``path`` is never left half-written (for example, if the app crashes
+    while saving).
+    """
+    # Replace the file that a symlink points to rather than the symlink itself.
+    path = path.resolve()
+    mode = "wb" if isinstance(contents, bytes) else "w"
+    f = tempfile.NamedTemporaryFile(mode, dir=path.parent, prefix=f".{path.name}.", delete=False)
+    try:
+        with f:
+            f.write(contents)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Temporary files are only readable by the owner, so keep the permissions of
+        # the file that is being replaced.
+        if path.exists():
+            os.chmod(f.name, stat.S_IMODE(path.stat().st_mode))
+        os.replace(f.name, path)
+    except Exception:
+        os.unlink(f.name)
+        raise
+
+
 @dataclass
 class ProviderConfiguration:
     id: str
@@ -232,12 +260,9 @@ class AppConfiguration(DataClassJsonMixin):
         assert self.filename
         # Save the config as YAML.
         self.filename.parent.mkdir(parents=True, exist_ok=True)
-        json = self.to_json(indent=2, sort_keys=True)
-        with open(self.filename, "w+") as f:
-            f.write(json)
+        write_atomically(self.filename, self.to_json(indent=2, sort_keys=True))
 
         # Save the state for the current provider.
         if state_filename := self._state_file_location:
             state_filename.parent.mkdir(parents=True, exist_ok=True)
-            with open(state_filename, "wb+") as f:
-                pickle.dump(self.state, f)
+            write_atomically(state_filename, pickle.dumps(self.state))
@@ -31,9 +31,6 @@ class MainWindow(Gtk.ApplicationWindow):
     }
 
     _updating_settings: bool = False
-    _pending_downloads: Set[str] = set()
-    _failed_downloads: Set[str] = set()
-    _current_download_boxes: Dict[str, Gtk.Box] = {}
     _failed_downloads_box: Optional[Gtk.Label] = None
     _pending_downloads_label: Optional[Gtk.Label] = None
     _current_downloads_placeholder: Optional[Gtk.Label] = None
@@ -42,6 +39,13 @@ class MainWindow(Gtk.ApplicationWindow):
         super().__init__(*args, **kwargs)
         self.set_default_size(1342, 756)
 
+        # These are mutated in place, so they must be per-instance rather than shared
+        # class-level defaults.
+        self._pending_downloads: Set[str] = set()
+        self._failed_downloads: Set[str] = set()
+        self._current_download_boxes: Dict[str, Gtk.Box] = {}
+        self.searches: Set[Result] = set()
+
         # Create the stack
         self.albums_panel = albums.AlbumsPanel()
         self.artists_panel = artists.ArtistsPanel()
@@ -934,7 +938,6 @@ class MainWindow(Gtk.ApplicationWindow):
         self._hide_search()
 
     search_idx = 0
-    searches: Set[Result] = set()
 
     def _on_search_entry_changed(self, entry: Gtk.Entry):
         while len(self.searches) > 0:
@@ -4,7 +4,7 @@ from random import randint
 from typing import Any, Dict, List, Tuple, cast
 
 from gi.repository import Gdk, Gio, GLib, GObject, Gtk, Pango
-from thefuzz import fuzz
+from rapidfuzz import fuzz
 
 from ..adapters import AdapterManager, api_objects as API
 from ..config import AppConfiguration
@@ -426,7 +426,7 @@ class PlaylistDetailPanel(Gtk.Overlay):
         )
 
         @lru_cache(maxsize=1024)
-        def row_score(key: str, row_items: Tuple[str]) -> int:
+        def row_score(key: str, row_items: Tuple[str]) -> float:
             return fuzz.partial_ratio(key, " ".join(row_items).lower())
 
         def playlist_song_list_search_fn(
@@ -11,6 +11,7 @@ from ..adapters.api_objects import Playlist, Song
 from ..config import AppConfiguration
 
 deep_diff_exclude_regexp = re.compile(r"root\[\d+\]\.props")
+diff_location_regexp = re.compile(r"root\[(\d*)\](?:\[(\d*)\]|\.(.*))?")
 
 
 def format_song_duration(duration_secs: Union[int, timedelta, None]) -> str:
@@ -119,7 +120,7 @@ def _parse_diff_location(location: str) -> Tuple:
     >>> _parse_diff_location("root[22].foo")
     ('22', 'foo')
     """
-    match = re.match(r"root\[(\d*)\](?:\[(\d*)\]|\.(.*))?", location)
+    match = diff_location_regexp.match(location)
     return tuple(g for g in cast(Match, match).groups() if g is not None)
 
 
@@ -1,5 +1,8 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import sleep
+from typing import Any, List, Optional, cast
 
 import pytest
 
@@ -39,6 +42,42 @@ def adapter_manager(tmp_path: Path):
     AdapterManager.shutdown()
 
 
+class StubSearchAdapter:
+    """
+    Stands in for the ground truth adapter. Each search blocks until ``release`` is set
+    so that tests can start other searches while it is in flight.
+    """
+
+    can_search = True
+    is_networked = False
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+        self.queries: List[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def search(self, query: str) -> SearchResult:
+        self.queries.append(query)
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return SearchResult(query)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def stub_search_adapter_manager():
+    instance = AdapterManager._AdapterManagerInternal(
+        cast(Any, StubSearchAdapter()), on_song_download_progress=lambda *a: None
+    )
+    yield instance
+    instance.shutdown()
+
+
 def test_result_immediate():
     result = Result(42)
     assert result.data_is_available
@@ -132,6 +171,49 @@ def test_get_song_details(adapter_manager: AdapterManager):
     pass
 
 
+def test_download_error_reaches_waiters(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(AdapterManager, "_instance", stub_search_adapter_manager)
+    # The adapter_manager fixture shuts down the shared executor, so use a new one.
+    download_executor = ThreadPoolExecutor()
+    monkeypatch.setattr(AdapterManager, "download_executor", download_executor)
+
+    started = threading.Event()
+    release = threading.Event()
+    requested_uris: List[str] = []
+
+    def fail_download(uri: str, **kwargs) -> Any:
+        requested_uris.append(uri)
+        started.set()
+        release.wait(5)
+        raise Exception("download failed")
+
+    monkeypatch.setattr("sublime_music.adapters.manager.requests.get", fail_download)
+
+    after_download_filenames: List[str] = []
+    first = AdapterManager._create_download_result(
+        "http://example.com/1", "1", after_download=after_download_filenames.append
+    )
+    assert started.wait(5)
+    second = AdapterManager._create_download_result(
+        "http://example.com/1", "1", after_download=after_download_filenames.append
+    )
+    sleep(0.1)
+    release.set()
+
+    # The second download waits for the first one, and gets its error rather than the
+    # path to a file that was never written.
+    for result in (first, second):
+        with pytest.raises(Exception, match="download failed"):
+            result.result()
+    assert requested_uris == ["http://example.com/1"]
+    assert after_download_filenames == []
+    assert AdapterManager.current_downloads == {}
+    download_executor.shutdown()
+
+
 def test_search_result_sort():
     search_results1 = SearchResult(query="foo")
     search_results1.add_results(
@@ -179,6 +261,144 @@ def test_search_result_update():
     assert [a.name for a in search_results1.artists] == ["foo", "another foo", "foo2"]
 
 
+def test_search_short_query(adapter_manager: AdapterManager):
+    results: List[SearchResult] = []
+    search = AdapterManager.search("a", search_callback=results.append)
+
+    # The search is not cancelled, so it resolves to False.
+    assert search.result() is False
+    assert len(results) == 1
+    assert results[0].query == "a"
+    assert results[0].artists == []
+    assert results[0].albums == []
+    assert results[0].songs == []
+    assert results[0].playlists == []
+
+
+def test_search_ground_truth_coalesces(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+):
+    instance = stub_search_adapter_manager
+    stub = cast(StubSearchAdapter, instance.ground_truth_adapter)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(instance.search_ground_truth, "foo")
+        assert stub.started.wait(5)
+        second = executor.submit(instance.search_ground_truth, "foo")
+        sleep(0.1)
+        stub.release.set()
+
+        first_result, first_requested = first.result()
+        second_result, second_requested = second.result()
+
+    # Only one request is made and both searches share its result.
+    assert stub.queries == ["foo"]
+    assert first_requested and not second_requested
+    assert second_result is first_result
+    assert instance.inflight_searches == {}
+
+    # Later searches for the same query are answered from the cache.
+    assert instance.get_cached_search_result("foo") is first_result
+    assert instance.search_ground_truth("foo") == (first_result, False)
+    assert stub.queries == ["foo"]
+
+
+def test_search_ground_truth_error(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+):
+    instance = stub_search_adapter_manager
+    stub = cast(StubSearchAdapter, instance.ground_truth_adapter)
+    stub.error = Exception("server error")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(instance.search_ground_truth, "foo")
+        assert stub.started.wait(5)
+        second = executor.submit(instance.search_ground_truth, "foo")
+        sleep(0.1)
+        stub.release.set()
+
+        # The error is raised in both searches.
+        for future in (first, second):
+            with pytest.raises(Exception, match="server error"):
+                future.result()
+
+    assert stub.queries == ["foo"]
+    assert instance.inflight_searches == {}
+    assert instance.get_cached_search_result("foo") is None
+
+    # Failed searches are not cached, so the next search tries again.
+    stub.error = None
+    result, requested = instance.search_ground_truth("foo")
+    assert requested
+    assert stub.queries == ["foo", "foo"]
+
+
+def test_search_results_cache(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    instance = stub_search_adapter_manager
+    monkeypatch.setattr("sublime_music.adapters.manager.SEARCH_RESULTS_CACHE_SIZE", 2)
+
+    results = {query: SearchResult(query) for query in ("foo", "bar", "baz")}
+    for query, result in results.items():
+        instance.cache_search_result(query, result)
+
+    # The oldest entry is evicted.
+    assert instance.get_cached_search_result("foo") is None
+    assert instance.get_cached_search_result("bar") is results["bar"]
+    assert instance.get_cached_search_result("baz") is results["baz"]
+
+    # Expired entries are not returned.
+    monkeypatch.setattr("sublime_music.adapters.manager.SEARCH_RESULTS_CACHE_TTL", -1)
+    assert instance.get_cached_search_result("bar") is None
+
+
+def test_search_results_cache_concurrent(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    instance = stub_search_adapter_manager
+    monkeypatch.setattr("sublime_music.adapters.manager.SEARCH_RESULTS_CACHE_SIZE", 2)
+
+    def cache_results(thread: int):
+        for i in range(1000):
+            query = f"{thread}-{i}"
+            instance.cache_search_result(query, SearchResult(query))
+            instance.get_cached_search_result(query)
+
+    # Caching from several threads at once must not raise while evicting.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(cache_results, t) for t in range(4)]:
+            future.result()
+
+    assert len(instance.search_results_cache) == 2
+
+
+def test_search_cancelled_during_server_request(
+    stub_search_adapter_manager: AdapterManager._AdapterManagerInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    instance = stub_search_adapter_manager
+    stub = cast(StubSearchAdapter, instance.ground_truth_adapter)
+    monkeypatch.setattr(AdapterManager, "_instance", instance)
+    # The adapter_manager fixture shuts down the shared executor, so use a new one.
+    executor = ThreadPoolExecutor()
+    monkeypatch.setattr(AdapterManager, "executor", executor)
+
+    results: List[SearchResult] = []
+    search = AdapterManager.search("foo", search_callback=results.append)
+    assert stub.started.wait(5)
+    search.cancel()
+    stub.release.set()
+
+    # The search finishes after it was cancelled, so it resolves to True and the
+    # (stale) results are not returned.
+    assert search.result() is True
+    assert results == []
+    executor.shutdown()
+
+
 def test_search(adapter_manager: AdapterManager):
     # TODO (#180)
     return
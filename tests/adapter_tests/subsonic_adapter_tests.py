@@ -2,6 +2,7 @@ import hashlib
 import json
 import logging
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Generator, List, Tuple
@@ -9,7 +10,7 @@ from typing import Any, Generator, List, Tuple
 import pytest
 from dateutil.tz import tzutc
 
-from sublime_music.adapters import ConfigurationStore
+from sublime_music.adapters import AlbumSearchQuery, ConfigurationStore
 from sublime_music.adapters.subsonic import SubsonicAdapter, api_objects as SubsonicAPI
 
 MOCK_DATA_FILES = Path(__file__).parent.joinpath("mock_data")
@@ -513,6 +514,53 @@ def test_get_album(adapter: SubsonicAdapter):
         ]
 
 
+@pytest.mark.parametrize(
+    "album_count, last_page_offset, batch_end",
+    [
+        # The first page isn't full, so no other pages are requested.
+        (120, 0, 500),
+        # A page in the middle of the first batch is short.
+        (1700, 1500, 2500),
+        # The last page is exactly full, so the batch after it is requested too.
+        (2500, 2500, 4500),
+    ],
+)
+def test_get_albums_pagination(
+    adapter: SubsonicAdapter,
+    monkeypatch: pytest.MonkeyPatch,
+    album_count: int,
+    last_page_offset: int,
+    batch_end: int,
+):
+    # The pages are requested concurrently, so answer each one by its offset rather
+    # than in the order that the mock data is set.
+    offsets_lock = threading.Lock()
+    offsets: List[int] = []
+
+    def get_json(url: str, offset: int = 0, size: int = 0, **params: Any) -> SubsonicAPI.Response:
+        with offsets_lock:
+            offsets.append(offset)
+        return SubsonicAPI.Response(
+            albums=SubsonicAPI.AlbumList2(
+                album=[
+                    SubsonicAPI.Album(id=str(i), name=f"Album {i}")
+                    for i in range(offset, min(offset + size, album_count))
+                ]
+            )
+        )
+
+    monkeypatch.setattr(adapter, "_get_json", get_json)
+    albums = adapter.get_albums(AlbumSearchQuery(AlbumSearchQuery.Type.ALPHABETICAL_BY_NAME))
+
+    assert [a.id for a in albums] == [str(i) for i in range(album_count)]
+
+    # Every page up to the short one is requested once. Pages after it in the same
+    # batch may be requested (or cancelled before they start), but no later batch is.
+    assert len(offsets) == len(set(offsets))
+    assert set(range(0, last_page_offset + 1, 500)) <= set(offsets)
+    assert max(offsets) < batch_end
+
+
 def test_get_music_directory(adapter: SubsonicAdapter):
     for filename, data in mock_data_files("get_music_directory"):
         logging.info(filename)
@@ -1,4 +1,6 @@
+import os
 import shutil
+import stat
 from pathlib import Path
 
 import pytest
@@ -91,3 +93,66 @@ def test_config_migrate_v5_to_v6(config_filename: Path, cwd: Path):
     app_config.save()
     app_config2 = AppConfiguration.load_from_file(config_filename)
     assert app_config == app_config2
+
+
+def test_save_leaves_no_temporary_files(config_filename: Path, tmp_path: Path):
+    config = AppConfiguration(filename=config_filename)
+    config.cache_location = tmp_path
+    config.providers["1"] = ProviderConfiguration(
+        id="1",
+        name="foo",
+        ground_truth_adapter_type=SubsonicAdapter,
+        ground_truth_adapter_config=ConfigurationStore(),
+    )
+    config.current_provider_id = "1"
+    config.save()
+    config.song_play_notification = False
+    config.save()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["1", config_filename.name]
+    assert [p.name for p in tmp_path.joinpath("1").iterdir()] == ["state.pickle"]
+
+    loaded_config = AppConfiguration.load_from_file(config_filename)
+    assert loaded_config.current_provider_id == "1"
+    assert loaded_config.song_play_notification is False
+
+
+def test_save_through_symlink(config_filename: Path, tmp_path: Path):
+    target = tmp_path.joinpath("dotfiles", "config.json")
+    target.parent.mkdir()
+    target.write_text("{}")
+    config_filename.symlink_to(target)
+
+    config = AppConfiguration(filename=config_filename)
+    config.cache_location = tmp_path
+    config.song_play_notification = False
+    config.save()
+
+    # The symlink is kept and the file that it points to is updated.
+    assert config_filename.is_symlink()
+    assert AppConfiguration.load_from_file(target).song_play_notification is False
+
+
+def test_save_keeps_file_mode(config_filename: Path, tmp_path: Path):
+    config = AppConfiguration(filename=config_filename)
+    config.cache_location = tmp_path
+    config.save()
+    config_filename.chmod(0o644)
+    config.save()
+
+    assert stat.S_IMODE(config_filename.stat().st_mode) == 0o644
+
+
+def test_save_failure_leaves_no_temporary_files(
+    config_filename: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    def fail_replace(*args):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    config = AppConfiguration(filename=config_filename)
+    config.cache_location = tmp_path
+    with pytest.raises(OSError, match="replace failed"):
+        config.save()
+
+    assert list(tmp_path.iterdir()) == []